@@ -57,6 +57,12 @@ def parse_args() -> argparse.Namespace:
         default="fig",
         help="Output directory for figures (default: fig).",
     )
+    parser.add_argument(
+        "--formats",
+        type=str,
+        default="pdf,png",
+        help="Comma-separated output formats, e.g. png to skip the PDF pass (default: pdf,png).",
+    )
     return parser.parse_args()
 
 
@@ -64,19 +70,20 @@ def main() -> None:
     args = parse_args()
     a_list = _parse_float_list(args.a_list, DEFAULT_A_LIST)
     i_list = _parse_float_list(args.i_list, DEFAULT_I_LIST)
+    formats = [item.strip() for item in args.formats.split(",") if item.strip()]
     panels = {args.panels} if args.panels != "all" else {"isco", "shadows_a", "shadows_i"}
 
     if "isco" in panels:
         a_grid = np.linspace(-0.99, 0.99, args.a_grid)
-        plot_isco_eta(a_grid, figdir=args.figdir)
+        plot_isco_eta(a_grid, figdir=args.figdir, formats=formats)
 
     if "shadows_a" in panels:
         inc = float(i_list[-1]) if args.i_list else 60.0
-        plot_shadow_family_for_a(a_list, inc_deg=inc, figdir=args.figdir)
+        plot_shadow_family_for_a(a_list, inc_deg=inc, figdir=args.figdir, formats=formats)
 
     if "shadows_i" in panels:
         a_value = a_list[-1] if a_list else 0.9
-        plot_shadow_family_for_i(i_list, a=a_value, figdir=args.figdir)
+        plot_shadow_family_for_i(i_list, a=a_value, figdir=args.figdir, formats=formats)
 
 
 if __name__ == "__main__":
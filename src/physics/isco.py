@@ -9,10 +9,33 @@ import numpy as np
 
 
 def _validate_spin(a: np.ndarray) -> None:
-    if np.any(np.abs(a) >= 1.0):
+    # Called once per public entry point; min/max avoid the |a| and mask temporaries.
+    if a.ndim == 0:
+        out_of_range = abs(float(a)) >= 1.0
+    else:
+        out_of_range = a.size > 0 and (a.max() >= 1.0 or a.min() <= -1.0)
+    if out_of_range:
         raise ValueError("Spin parameter must satisfy |a| < 1.")
 
 
+def _bardeen(abs_a: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    # Z1 and Z2 for an at least 1-d array of |a|; the only implementation in the module.
+    cbrt_plus = np.cbrt(1.0 + abs_a)
+    cbrt_minus = np.cbrt(1.0 - abs_a)
+    # Z1 = 1 + cbrt(1 - a^2) (cbrt(1 + a) + cbrt(1 - a)), where cbrt(1 - a^2)
+    # factorises as cbrt(1 + a) * cbrt(1 - a).
+    z1_val = np.add(cbrt_plus, cbrt_minus)
+    z1_val *= cbrt_plus
+    z1_val *= cbrt_minus
+    z1_val += 1.0
+    # The cube-root buffers are free from here on and hold Z2.
+    z2_val = np.multiply(abs_a, abs_a, out=cbrt_plus)
+    z2_val *= 3.0
+    z2_val += np.multiply(z1_val, z1_val, out=cbrt_minus)
+    np.sqrt(z2_val, out=z2_val)
+    return z1_val, z2_val
+
+
 def z1(a: float) -> float:
     """Intermediate quantity Z1(a) from Bardeen et al. (1972).
 
@@ -22,20 +45,62 @@ def z1(a: float) -> float:
         Dimensionless spin parameter with |a| < 1.
     """
 
-    a_arr = np.asarray(a, dtype=float)
+    a_arr = np.array([abs(float(a))])
     _validate_spin(a_arr)
-    abs_a = np.abs(a_arr)
-    term = np.cbrt(1.0 - abs_a * abs_a)
-    z1_val = 1.0 + term * (np.cbrt(1.0 + abs_a) + np.cbrt(1.0 - abs_a))
-    return float(z1_val)
+    z1_val, _ = _bardeen(a_arr)
+    return float(z1_val[0])
 
 
 def z2(a: float) -> float:
     """Intermediate quantity Z2(a) from Bardeen et al. (1972)."""
 
-    z1_val = z1(a)
-    a_val = float(a)
-    return float(np.sqrt(3.0 * a_val * a_val + z1_val * z1_val))
+    a_arr = np.array([abs(float(a))])
+    _validate_spin(a_arr)
+    _, z2_val = _bardeen(a_arr)
+    return float(z2_val[0])
+
+
+def _circular_energy(r_arr: np.ndarray, a_term: np.ndarray) -> np.ndarray:
+    # Expects r_arr and a_term broadcast to a common, at least 1-d, shape so the
+    # whole chain runs in three buffers without per-step temporaries.
+    sqrt_r = np.sqrt(r_arr)
+    numerator = np.subtract(r_arr, 2.0)
+    numerator *= sqrt_r
+    numerator += a_term
+    inner = np.subtract(r_arr, 3.0)
+    inner *= sqrt_r
+    inner += a_term
+    inner += a_term
+    if np.any(inner <= 0.0):
+        raise ValueError("Geodesic is not stable at the supplied radius.")
+    # r^0.75 * sqrt(inner) = sqrt(r) * sqrt(sqrt(r) * inner): no pow, one sqrt fewer.
+    denominator = np.multiply(inner, sqrt_r, out=inner)
+    np.sqrt(denominator, out=denominator)
+    denominator *= sqrt_r
+    numerator /= denominator
+    return numerator
+
+
+def _isco_core(a_arr: np.ndarray, prograde: bool) -> tuple[np.ndarray, np.ndarray]:
+    """ISCO radius and specific energy in a single pass over validated spins."""
+
+    abs_a = np.abs(np.atleast_1d(a_arr))
+    z1_val, z2_val = _bardeen(abs_a)
+    root = np.subtract(3.0, z1_val)
+    z1_val += 3.0
+    z1_val += z2_val
+    z1_val += z2_val
+    root *= z1_val
+    np.sqrt(root, out=root)
+    radius = np.add(z2_val, 3.0, out=z2_val)
+    if prograde:
+        radius -= root
+        a_term = abs_a
+    else:
+        radius += root
+        a_term = np.negative(abs_a, out=abs_a)
+    energy = _circular_energy(radius, a_term)
+    return radius.reshape(np.shape(a_arr)), energy.reshape(np.shape(a_arr))
 
 
 def r_isco(a: float | np.ndarray, prograde: bool = True) -> np.ndarray | float:
@@ -43,14 +108,8 @@ def r_isco(a: float | np.ndarray, prograde: bool = True) -> np.ndarray | float:
 
     a_arr = np.asarray(a, dtype=float)
     _validate_spin(a_arr)
-    abs_a = np.abs(a_arr)
-    term = np.cbrt(1.0 - abs_a * abs_a)
-    z1_val = 1.0 + term * (np.cbrt(1.0 + abs_a) + np.cbrt(1.0 - abs_a))
-    z2_val = np.sqrt(3.0 * abs_a * abs_a + z1_val * z1_val)
-    root = np.sqrt((3.0 - z1_val) * (3.0 + z1_val + 2.0 * z2_val))
-    sigma = -1.0 if prograde else 1.0
-    radius = 3.0 + z2_val + sigma * root
-    return float(radius) if np.isscalar(a_arr) else radius
+    radius, _ = _isco_core(a_arr, prograde)
+    return float(radius) if a_arr.ndim == 0 else radius
 
 
 def E_equatorial(r: float | np.ndarray, a: float | np.ndarray, prograde: bool = True) -> np.ndarray | float:
@@ -63,23 +122,16 @@ def E_equatorial(r: float | np.ndarray, a: float | np.ndarray, prograde: bool =
     _validate_spin(a_arr)
     abs_a = np.abs(a_arr)
     a_term = abs_a if prograde else -abs_a
-    sqrt_r = np.sqrt(r_arr)
-    r32 = r_arr * sqrt_r
-    numerator = r32 - 2.0 * sqrt_r + a_term
-    inner = r32 - 3.0 * sqrt_r + 2.0 * a_term
-    if np.any(inner <= 0.0):
-        raise ValueError("Geodesic is not stable at the supplied radius.")
-    denominator = np.power(r_arr, 0.75) * np.sqrt(inner)
-    energy = numerator / denominator
-    return float(energy) if np.isscalar(r_arr) and np.isscalar(a_arr) else energy
+    r_vec, a_vec = np.broadcast_arrays(np.atleast_1d(r_arr), np.atleast_1d(a_term))
+    energy = _circular_energy(r_vec, a_vec).reshape(np.broadcast_shapes(r_arr.shape, a_arr.shape))
+    return float(energy) if r_arr.ndim == 0 and a_arr.ndim == 0 else energy
 
 
 def eta(a: float | np.ndarray, prograde: bool = True) -> np.ndarray | float:
     """Radiative efficiency eta(a) = 1 - E_ISCO."""
 
-    radii = r_isco(a, prograde=prograde)
-    energies = E_equatorial(radii, a, prograde=prograde)
+    a_arr = np.asarray(a, dtype=float)
+    _validate_spin(a_arr)
+    _, energies = _isco_core(a_arr, prograde)
     efficiency = 1.0 - energies
-    radii_arr = np.asarray(radii)
-    return float(efficiency) if np.isscalar(radii_arr) else efficiency
-
+    return float(efficiency) if a_arr.ndim == 0 else efficiency
@@ -2,19 +2,43 @@
 
 from __future__ import annotations
 
+import math
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Iterable
+
 import numpy as np
 
 
 _FACEON_TOL = 1.0e-6
+# Spherical-orbit radii are sampled from just outside the horizon out to _R_MAX.
+_R_PAD = 1.0e-6
+_R_MAX = 20.0
+_UNIT_CIRCLE_CACHE: dict[int, tuple[np.ndarray, np.ndarray]] = {}
+_BOUNDARY_CACHE_SIZE = 512
+_BOUNDARY_CACHE: OrderedDict[tuple[float, float, int], tuple[np.ndarray, np.ndarray]] = OrderedDict()
+
+
+def _validate_spin(a: float) -> None:
+    if abs(a) >= 1.0:
+        raise ValueError("Spin parameter must satisfy |a| < 1.")
 
 
 def horizon_radius(a: float) -> float:
     """Outer horizon radius r_plus = 1 + sqrt(1 - a^2)."""
 
     a_val = float(a)
-    if abs(a_val) >= 1.0:
-        raise ValueError("Spin parameter must satisfy |a| < 1.")
-    return 1.0 + np.sqrt(1.0 - a_val * a_val)
+    _validate_spin(a_val)
+    return 1.0 + math.sqrt(1.0 - a_val * a_val)
+
+
+def _xi_eta_vec(r: float | np.ndarray, a: float) -> tuple[float | np.ndarray, float | np.ndarray]:
+    Delta = r * r - 2.0 * r + a * a
+    Delta_p = 2.0 * r - 2.0
+    A = 4.0 * r * Delta / Delta_p
+    xi = ((r * r + a * a) * Delta_p - 4.0 * r * Delta) / (a * Delta_p)
+    eta = A * A / Delta - (xi - a) * (xi - a)
+    return xi, eta
 
 
 def xi_eta_spherical(r: float, a: float) -> tuple[float, float]:
@@ -32,72 +56,73 @@ def xi_eta_spherical(r: float, a: float) -> tuple[float, float]:
         raise ValueError("a=0 handled analytically; xi undefined due to division by a.")
     if r <= horizon_radius(a):
         raise ValueError("Radius must exceed the event horizon.")
-    Delta = r * r - 2.0 * r + a * a
-    Delta_p = 2.0 * r - 2.0
-    if abs(Delta_p) < 1.0e-12:
+    if abs(2.0 * r - 2.0) < 1.0e-12:
         raise ValueError("Derivative of Delta too small for stable spherical orbit.")
-    A = 4.0 * r * Delta / Delta_p
-    xi = ((r * r + a * a) * Delta_p - 4.0 * r * Delta) / (a * Delta_p)
-    B = (A * A) / Delta
-    eta = B - (xi - a) * (xi - a)
+    xi, eta = _xi_eta_vec(r, a)
     return float(xi), float(eta)
 
 
-def screen_coords(xi: float, eta: float, a: float, inc_deg: float) -> tuple[float, float]:
-    """Project constants of motion to observer screen coordinates (alpha, beta)."""
-
-    i_rad = np.deg2rad(inc_deg)
-    sin_i = np.sin(i_rad)
-    cos_i = np.cos(i_rad)
+def _inclination_trig(inc_deg: float) -> tuple[float, float]:
+    i_rad = math.radians(inc_deg)
+    sin_i = math.sin(i_rad)
+    cos_i = math.cos(i_rad)
     if abs(sin_i) < 1.0e-15:
-        sin_i = np.sign(sin_i) * 1.0e-15 if sin_i != 0.0 else 1.0e-15
+        sin_i = math.copysign(1.0e-15, sin_i) if sin_i != 0.0 else 1.0e-15
+    return sin_i, cos_i
+
+
+def _screen_kernel(
+    xi: float | np.ndarray, eta: float | np.ndarray, a: float, sin_i: float, cos_i: float
+) -> tuple[float | np.ndarray, float | np.ndarray]:
     alpha = -xi / sin_i
     beta_sq = eta + (a * a) * cos_i * cos_i - (xi * xi) * (cos_i * cos_i) / (sin_i * sin_i)
+    return alpha, beta_sq
+
+
+def _project(xi: np.ndarray, eta: np.ndarray, a: float, inc_deg: float) -> tuple[np.ndarray, np.ndarray]:
+    """Vectorized screen projection; beta is NaN where the orbit misses the observer."""
+
+    sin_i, cos_i = _inclination_trig(inc_deg)
+    alpha, beta_sq = _screen_kernel(xi, eta, a, sin_i, cos_i)
+    beta = np.sqrt(np.where(beta_sq >= 0.0, beta_sq, np.nan))
+    return alpha, beta
+
+
+def screen_coords(xi: float, eta: float, a: float, inc_deg: float) -> tuple[float, float]:
+    """Project constants of motion to observer screen coordinates (alpha, beta)."""
+
+    sin_i, cos_i = _inclination_trig(inc_deg)
+    alpha, beta_sq = _screen_kernel(xi, eta, a, sin_i, cos_i)
     if beta_sq < 0.0:
         return float("nan"), float("nan")
-    beta = np.sqrt(beta_sq)
-    return float(alpha), float(beta)
+    return float(alpha), math.sqrt(beta_sq)
 
 
+@lru_cache(maxsize=512)
 def _solve_face_on_radius(a: float) -> float:
-    r_min = horizon_radius(a) + 1.0e-6
-    r_max = 20.0
-    grid = np.linspace(r_min, r_max, 2000)
-    xi_vals = []
-    for r in grid:
-        try:
-            xi_val, _ = xi_eta_spherical(float(r), a)
-        except ValueError:
-            xi_vals.append(np.nan)
-            continue
-        xi_vals.append(xi_val)
-    xi_vals = np.asarray(xi_vals)
-    valid = ~np.isnan(xi_vals)
-    grid = grid[valid]
-    xi_vals = xi_vals[valid]
-    for idx in range(len(grid) - 1):
-        f0 = xi_vals[idx]
-        f1 = xi_vals[idx + 1]
-        if f0 == 0.0:
-            return float(grid[idx])
-        if f0 * f1 < 0.0:
-            lo = grid[idx]
-            hi = grid[idx + 1]
-            for _ in range(80):
-                mid = 0.5 * (lo + hi)
-                f_mid, _ = xi_eta_spherical(float(mid), a)
-                if f_mid == 0.0:
-                    return float(mid)
-                if f0 * f_mid < 0.0:
-                    hi = mid
-                    f1 = f_mid
-                else:
-                    lo = mid
-                    f0 = f_mid
-            return float(0.5 * (lo + hi))
+    # Face-on photons have xi(r) = -(r^3 - 3 r^2 + a^2 r + a^2) / (a (r - 1)) = 0.
+    # The cubic numerator is increasing and convex beyond its root, so Newton
+    # started at the Schwarzschild photon sphere r = 3 converges from above.
+    a2 = a * a
+    r = 3.0
+    for _ in range(50):
+        cubic = ((r - 3.0) * r + a2) * r + a2
+        slope = (3.0 * r - 6.0) * r + a2
+        step = cubic / slope
+        r -= step
+        if abs(step) < 1.0e-14 * r:
+            return r
     raise RuntimeError("Unable to locate face-on spherical orbit for the provided spin.")
 
 
+def _unit_circle(n: int) -> tuple[np.ndarray, np.ndarray]:
+    # Face-on and Schwarzschild shadows are circles; sample cos/sin once per n.
+    if n not in _UNIT_CIRCLE_CACHE:
+        theta = np.linspace(0.0, 2.0 * np.pi, n, endpoint=False)
+        _UNIT_CIRCLE_CACHE[n] = (np.cos(theta), np.sin(theta))
+    return _UNIT_CIRCLE_CACHE[n]
+
+
 def _face_on_boundary(a: float, n: int) -> tuple[np.ndarray, np.ndarray]:
     if abs(a) < 1.0e-12:
         radius = np.sqrt(27.0)
@@ -107,47 +132,121 @@ def _face_on_boundary(a: float, n: int) -> tuple[np.ndarray, np.ndarray]:
         radius = np.sqrt(eta_val + a * a)
         if not np.isfinite(radius):
             raise RuntimeError("Face-on radius computation failed.")
-    theta = np.linspace(0.0, 2.0 * np.pi, n, endpoint=False)
-    return radius * np.cos(theta), radius * np.sin(theta)
+    cos_t, sin_t = _unit_circle(n)
+    return radius * cos_t, radius * sin_t
 
 
-def shadow_boundary(a: float, inc_deg: float, n: int = 4000) -> tuple[np.ndarray, np.ndarray]:
-    """Sample the spherical-photon family to trace the Kerr shadow boundary."""
+def _radius_grid(r_horizon: float | np.ndarray, n: int) -> np.ndarray:
+    # One row of n // 2 radii per horizon; an array of horizons gives a (spin, radius) grid.
+    return np.linspace(np.add(r_horizon, _R_PAD), _R_MAX, n // 2, axis=-1)
 
-    if n < 100:
-        raise ValueError("Number of samples should be >= 100 for stability.")
 
+@lru_cache(maxsize=64)
+def _shadow_xi_eta(a: float, n: int) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    # xi(r) and eta(r) depend only on the spin, so every inclination of a
+    # family shares them; the cached arrays are read-only.
+    r_grid = _radius_grid(horizon_radius(a), n)
+    xi, eta_val = _xi_eta_vec(r_grid, a)
+    for arr in (r_grid, xi, eta_val):
+        arr.flags.writeable = False
+    return r_grid, xi, eta_val
+
+
+def _close_boundary(alpha: np.ndarray, beta: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    # Drop orbits that miss the observer and mirror the upper half to close the curve.
+    # The visible orbits form one run of r along which alpha is monotone, so the
+    # upper half forward followed by the lower half reversed is already in
+    # traversal order and needs no angular sort.
+    valid = np.isfinite(alpha) & np.isfinite(beta)
+    if not np.any(valid):
+        return np.array([]), np.array([])
+
+    m = int(np.count_nonzero(valid))
+    alphas = np.empty(2 * m)
+    betas = np.empty(2 * m)
+    alphas[:m] = alpha[valid]
+    alphas[m:] = alphas[:m][::-1]
+    betas[:m] = beta[valid]
+    np.negative(betas[:m][::-1], out=betas[m:])
+    return alphas, betas
+
+
+def _compute_boundary(a: float, inc_deg: float, n: int) -> tuple[np.ndarray, np.ndarray]:
     if abs(a) < 1.0e-12:
-        theta = np.linspace(0.0, 2.0 * np.pi, n, endpoint=False)
+        cos_t, sin_t = _unit_circle(n)
         radius = np.sqrt(27.0)
-        return radius * np.cos(theta), radius * np.sin(theta)
+        return radius * cos_t, radius * sin_t
 
     if abs(np.sin(np.deg2rad(inc_deg))) < _FACEON_TOL:
         return _face_on_boundary(a, n)
 
-    r_min = horizon_radius(a) + 1.0e-6
-    r_max = 20.0
-    r_grid = np.linspace(r_min, r_max, n // 2)
-    points: list[tuple[float, float]] = []
-    for r in r_grid:
-        try:
-            xi, eta_val = xi_eta_spherical(r, a)
-        except ValueError:
-            continue
-        alpha, beta = screen_coords(xi, eta_val, a, inc_deg)
-        if np.isnan(alpha) or np.isnan(beta):
-            continue
-        points.append((alpha, beta))
-        points.append((alpha, -beta))
-
-    if not points:
-        return np.array([]), np.array([])
+    _, xi, eta_val = _shadow_xi_eta(a, n)
+    alpha, beta = _project(xi, eta_val, a, inc_deg)
+    return _close_boundary(alpha, beta)
+
+
+def _boundary_key(a: float, inc_deg: float, n: int) -> tuple[float, float, int]:
+    # Validated memo key shared by the single and batched entry points; rounding
+    # to 1e-9 keeps float noise from defeating the cache. The key only indexes
+    # _BOUNDARY_CACHE: boundaries are computed from the caller's unrounded values,
+    # since a valid spin such as 1 - 1e-10 rounds to exactly 1.
+    if n < 100:
+        raise ValueError("Number of samples should be >= 100 for stability.")
+    a_val = float(a)
+    _validate_spin(a_val)
+    return round(a_val, 9), round(float(inc_deg), 9), int(n)
+
+
+def _remember_boundary(key: tuple[float, float, int], boundary: tuple[np.ndarray, np.ndarray]) -> None:
+    _BOUNDARY_CACHE[key] = boundary
+    _BOUNDARY_CACHE.move_to_end(key)
+    if len(_BOUNDARY_CACHE) > _BOUNDARY_CACHE_SIZE:
+        _BOUNDARY_CACHE.popitem(last=False)
+
+
+def shadow_boundary(a: float, inc_deg: float, n: int = 4000) -> tuple[np.ndarray, np.ndarray]:
+    """Sample the spherical-photon family to trace the Kerr shadow boundary.
+
+    Boundaries are memoized on (a, inc_deg, n) rounded to 1e-9, so repeated
+    figure and GIF frames reuse earlier work; callers receive fresh copies.
+    """
+
+    key = _boundary_key(a, inc_deg, n)
+    boundary = _BOUNDARY_CACHE.get(key)
+    if boundary is None:
+        boundary = _compute_boundary(float(a), float(inc_deg), int(n))
+    _remember_boundary(key, boundary)
+    alpha, beta = boundary
+    return alpha.copy(), beta.copy()
+
+
+def shadow_boundaries_for_spins(
+    spins: Iterable[float], inc_deg: float, n: int = 4000
+) -> list[tuple[np.ndarray, np.ndarray]]:
+    """Shadow boundaries for several spins at one inclination.
+
+    Equivalent to calling shadow_boundary per spin and sharing its memo, but
+    the spherical-orbit family of every uncached Kerr spin is evaluated in a
+    single (spin, radius) broadcast.
+    """
 
-    pts = np.asarray(points)
-    angles = np.arctan2(pts[:, 1], pts[:, 0])
-    order = np.argsort(angles)
-    pts = pts[order]
-    return pts[:, 0], pts[:, 1]
+    spin_list = [float(a) for a in spins]
+    keys = [_boundary_key(a, inc_deg, n) for a in spin_list]
+    missing: dict[tuple[float, float, int], float] = {}
+    for a, key in zip(spin_list, keys):
+        if key not in _BOUNDARY_CACHE and abs(a) >= 1.0e-12:
+            missing.setdefault(key, a)
+    if missing and abs(np.sin(np.deg2rad(inc_deg))) >= _FACEON_TOL:
+        a_arr = np.array(list(missing.values()))
+        r_grid = _radius_grid(np.array([horizon_radius(a) for a in a_arr]), n)
+        a_col = a_arr[:, None]
+        xi, eta_val = _xi_eta_vec(r_grid, a_col)
+        alpha, beta = _project(xi, eta_val, a_col, inc_deg)
+        for row, key in enumerate(missing):
+            _remember_boundary(key, _close_boundary(alpha[row], beta[row]))
+    # Schwarzschild and face-on boundaries, and anything already memoized,
+    # are served by shadow_boundary itself.
+    return [shadow_boundary(a, inc_deg, n=n) for a in spin_list]
 
 
 def boundary_metrics(alpha: np.ndarray, beta: np.ndarray) -> dict:
@@ -157,7 +256,9 @@ def boundary_metrics(alpha: np.ndarray, beta: np.ndarray) -> dict:
         return {"D_h": np.nan, "D_v": np.nan, "R_eq": np.nan}
     D_h = float(np.nanmax(alpha) - np.nanmin(alpha))
     D_v = float(np.nanmax(beta) - np.nanmin(beta))
-    area = 0.5 * np.abs(np.dot(alpha, np.roll(beta, -1)) - np.dot(beta, np.roll(alpha, -1)))
+    # Shoelace formula on slices; the closing edge is added separately to avoid np.roll copies.
+    cross = np.sum(alpha[:-1] * beta[1:] - alpha[1:] * beta[:-1])
+    area = 0.5 * np.abs(cross + (alpha[-1] * beta[0] - alpha[0] * beta[-1]))
     R_eq = float(np.sqrt(area / np.pi))
     return {"D_h": D_h, "D_v": D_v, "R_eq": R_eq}
 
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 import imageio.v2 as imageio
@@ -10,28 +11,67 @@ import matplotlib
 matplotlib.use("Agg", force=True)
 import matplotlib.pyplot as plt
 import numpy as np
+from matplotlib.lines import Line2D
+from matplotlib.text import Text
 
-from src.physics.shadow import shadow_boundary
+from src.physics.shadow import shadow_boundaries_for_spins, shadow_boundary
+
+
+# Half-width of the fixed GIF viewport; Kerr shadows stay within |alpha|, |beta| < 7 M.
+_FRAME_LIMIT = 8.0
+_FRAME_STATE: tuple[plt.Figure, plt.Axes, Line2D, Text, object] | None = None
 
 
 def _ensure_dir(path: Path) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
 
 
+def _frame_canvas() -> tuple[plt.Figure, plt.Axes, Line2D, Text, object]:
+    # One figure per process, reused for every frame: the static axes are drawn
+    # once and cached, and each frame only blits the boundary and title on top.
+    global _FRAME_STATE
+    if _FRAME_STATE is None:
+        fig, ax = plt.subplots(figsize=(4.0, 4.0), dpi=200)
+        (line,) = ax.plot([], [], color="black")
+        ax.set_xlim(-_FRAME_LIMIT, _FRAME_LIMIT)
+        ax.set_ylim(-_FRAME_LIMIT, _FRAME_LIMIT)
+        ax.set_aspect("equal", adjustable="box")
+        ax.set_xlabel(r"$\alpha$ [M]")
+        ax.set_ylabel(r"$\beta$ [M]")
+        title = ax.set_title("a = +0.000, i = 0.0 deg")
+        ax.grid(True, which="major", alpha=0.2)
+        fig.tight_layout()
+        line.set_animated(True)
+        title.set_animated(True)
+        fig.canvas.draw()
+        background = fig.canvas.copy_from_bbox(fig.bbox)
+        _FRAME_STATE = (fig, ax, line, title, background)
+    return _FRAME_STATE
+
+
 def _frame(alpha: np.ndarray, beta: np.ndarray, title: str) -> np.ndarray:
-    fig, ax = plt.subplots(figsize=(4.0, 4.0), dpi=200)
-    ax.plot(alpha, beta, color="black")
-    ax.set_aspect("equal", adjustable="box")
-    ax.set_xlabel(r"$\alpha$ [M]")
-    ax.set_ylabel(r"$\beta$ [M]")
-    ax.set_title(title)
-    ax.grid(True, which="major", alpha=0.2)
-    fig.tight_layout()
-    fig.canvas.draw()
-    buffer = np.asarray(fig.canvas.buffer_rgba())
-    image = buffer[:, :, :3].copy()
-    plt.close(fig)
-    return image
+    fig, ax, line, title_text, background = _frame_canvas()
+    fig.canvas.restore_region(background)
+    line.set_data(alpha, beta)
+    title_text.set_text(title)
+    ax.draw_artist(line)
+    ax.draw_artist(title_text)
+    # The canvas is reused for the next frame, so snapshot it; copying the
+    # contiguous RGBA buffer whole is cheaper than a strided RGB slice copy,
+    # and imageio writes RGBA frames to GIF directly.
+    return np.array(fig.canvas.buffer_rgba())
+
+
+def _render_frame(args: tuple[np.ndarray, np.ndarray, str]) -> np.ndarray:
+    alpha, beta, title = args
+    return _frame(alpha, beta, title=title)
+
+
+def _render_frames(arg_list: list[tuple[np.ndarray, np.ndarray, str]]) -> list[np.ndarray]:
+    # Boundaries are computed up front; rasterizing the independent frames is
+    # spread over separate processes to sidestep the GIL.
+    with ProcessPoolExecutor() as pool:
+        return list(pool.map(_render_frame, arg_list))
 
 
 def spin_sweep_gif(
@@ -44,10 +84,10 @@ def spin_sweep_gif(
     """Animate the shadow as the spin parameter varies linearly."""
 
     spins = np.linspace(a_start, a_end, frames)
-    images = []
-    for a in spins:
-        alpha, beta = shadow_boundary(float(a), i, n=2048)
-        images.append(_frame(alpha, beta, title=f"a = {a:+.3f}, i = {i:.1f} deg"))
+    boundaries = shadow_boundaries_for_spins(spins, i, n=2048)
+    images = _render_frames(
+        [(alpha, beta, f"a = {a:+.3f}, i = {i:.1f} deg") for a, (alpha, beta) in zip(spins, boundaries)]
+    )
     output = Path(out)
     _ensure_dir(output)
     imageio.mimsave(output, images, duration=0.1)
@@ -64,10 +104,12 @@ def inclination_sweep_gif(
     """Animate the shadow as the observer inclination varies linearly."""
 
     inclinations = np.linspace(i_start, i_end, frames)
-    images = []
-    for inc in inclinations:
-        alpha, beta = shadow_boundary(a, float(inc), n=2048)
-        images.append(_frame(alpha, beta, title=f"a = {a:+.3f}, i = {inc:.1f} deg"))
+    images = _render_frames(
+        [
+            (*shadow_boundary(a, float(inc), n=2048), f"a = {a:+.3f}, i = {inc:.1f} deg")
+            for inc in inclinations
+        ]
+    )
     output = Path(out)
     _ensure_dir(output)
     imageio.mimsave(output, images, duration=0.1)
@@ -13,7 +13,10 @@ import numpy as np
 
 from src.physics.isco import eta as eta_fn
 from src.physics.isco import r_isco
-from src.physics.shadow import shadow_boundary
+from src.physics.shadow import shadow_boundaries_for_spins, shadow_boundary
+
+
+DEFAULT_FORMATS = ("pdf", "png")
 
 
 def _ensure_dir(figdir: str | Path) -> Path:
@@ -22,11 +25,13 @@ def _ensure_dir(figdir: str | Path) -> Path:
     return path
 
 
-def _save(fig: plt.Figure, base: Path) -> None:
-    pdf_path = base.parent / f"{base.name}.pdf"
-    png_path = base.parent / f"{base.name}.png"
-    fig.savefig(pdf_path, bbox_inches="tight")
-    fig.savefig(png_path, dpi=300, bbox_inches="tight")
+def _save(fig: plt.Figure, base: Path, formats: Iterable[str] = DEFAULT_FORMATS) -> None:
+    for ext in formats:
+        path = base.parent / f"{base.name}.{ext}"
+        if ext == "png":
+            fig.savefig(path, dpi=300, bbox_inches="tight")
+        else:
+            fig.savefig(path, bbox_inches="tight")
     plt.close(fig)
 
 
@@ -36,7 +41,9 @@ def _set_shadow_axes(ax: plt.Axes) -> None:
     ax.set_ylabel(r"$\beta$ [M]")
 
 
-def plot_isco_eta(a_grid: np.ndarray, figdir: str = "fig") -> None:
+def plot_isco_eta(
+    a_grid: np.ndarray, figdir: str = "fig", formats: Iterable[str] = DEFAULT_FORMATS
+) -> None:
     """Plot ISCO radius and efficiency over a grid of spin values."""
 
     fig_path = _ensure_dir(figdir)
@@ -51,7 +58,7 @@ def plot_isco_eta(a_grid: np.ndarray, figdir: str = "fig") -> None:
     ax.set_ylabel(r"$r_{\mathrm{ISCO}}$ [M]")
     ax.legend()
     ax.grid(True, which="major", alpha=0.2)
-    _save(fig, fig_path / "isco_radius_vs_a")
+    _save(fig, fig_path / "isco_radius_vs_a", formats)
 
     fig, ax = plt.subplots(figsize=(6.5, 4.5))
     ax.plot(a_grid, eta_fn(a_grid, prograde=True), label=r"$\eta$ prograde")
@@ -60,24 +67,28 @@ def plot_isco_eta(a_grid: np.ndarray, figdir: str = "fig") -> None:
     ax.set_ylabel(r"$\eta$")
     ax.legend()
     ax.grid(True, which="major", alpha=0.2)
-    _save(fig, fig_path / "eta_vs_a")
+    _save(fig, fig_path / "eta_vs_a", formats)
 
 
-def plot_shadow_family_for_a(a_list: Iterable[float], inc_deg: float, figdir: str = "fig") -> None:
+def plot_shadow_family_for_a(
+    a_list: Iterable[float], inc_deg: float, figdir: str = "fig", formats: Iterable[str] = DEFAULT_FORMATS
+) -> None:
     """Overlay multiple spin values at fixed inclination."""
 
     fig_path = _ensure_dir(figdir)
     fig, ax = plt.subplots(figsize=(6.0, 6.0))
-    for a in a_list:
-        alpha, beta = shadow_boundary(a, inc_deg, n=4096)
+    a_list = list(a_list)
+    for a, (alpha, beta) in zip(a_list, shadow_boundaries_for_spins(a_list, inc_deg, n=4096)):
         ax.plot(alpha, beta, label=f"a={a:+.2f}")
     _set_shadow_axes(ax)
     ax.legend(frameon=False)
     ax.grid(True, which="major", alpha=0.2)
-    _save(fig, fig_path / f"shadow_multi_a_i{int(round(inc_deg))}")
+    _save(fig, fig_path / f"shadow_multi_a_i{int(round(inc_deg))}", formats)
 
 
-def plot_shadow_family_for_i(inc_list: Iterable[float], a: float, figdir: str = "fig") -> None:
+def plot_shadow_family_for_i(
+    inc_list: Iterable[float], a: float, figdir: str = "fig", formats: Iterable[str] = DEFAULT_FORMATS
+) -> None:
     """Overlay multiple inclinations for a fixed spin."""
 
     fig_path = _ensure_dir(figdir)
@@ -88,5 +99,5 @@ def plot_shadow_family_for_i(inc_list: Iterable[float], a: float, figdir: str =
     _set_shadow_axes(ax)
     ax.legend(frameon=False)
     ax.grid(True, which="major", alpha=0.2)
-    _save(fig, fig_path / f"shadow_multi_i_a{a:+.2f}")
+    _save(fig, fig_path / f"shadow_multi_i_a{a:+.2f}", formats)
 
@@ -1,6 +1,6 @@
 import numpy as np
 
-from src.physics.isco import eta, r_isco
+from src.physics.isco import E_equatorial, eta, r_isco
 
 
 def test_schwarzschild_r_isco():
@@ -19,3 +19,9 @@ def test_monotonic_trends():
     assert np.all(np.diff(prograde) < 0.0)
     assert np.all(np.diff(retrograde) > 0.0)
 
+
+
+def test_scalar_inputs_return_float():
+    assert isinstance(r_isco(0.5), float)
+    assert isinstance(eta(0.5), float)
+    assert isinstance(E_equatorial(7.0, 0.2), float)
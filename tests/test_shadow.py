@@ -1,15 +1,14 @@
 import itertools
 
 import numpy as np
+import pytest
 
-from src.physics.shadow import boundary_metrics, shadow_boundary
+from src.physics.shadow import boundary_metrics, shadow_boundaries_for_spins, shadow_boundary
 
 
 def circle_stats(alpha: np.ndarray, beta: np.ndarray) -> tuple[float, float]:
-    x0 = np.mean(alpha)
-    y0 = np.mean(beta)
-    radii = np.sqrt((alpha - x0) ** 2 + (beta - y0) ** 2)
-    return float(np.mean(radii)), float(np.std(radii))
+    radii = np.hypot(alpha - alpha.mean(), beta - beta.mean())
+    return float(radii.mean()), float(radii.std())
 
 
 def test_schwarzschild_circle():
@@ -33,6 +32,15 @@ def test_no_nans_across_grid():
         assert not np.any(np.isnan(beta))
 
 
+def test_boundary_traversal_order():
+    alpha, beta = shadow_boundary(0.9, 60.0, n=2048)
+    half = alpha.size // 2
+    steps = np.diff(alpha[:half])
+    assert np.all(steps > 0.0) or np.all(steps < 0.0)
+    assert np.array_equal(alpha[half:], alpha[:half][::-1])
+    assert np.array_equal(beta[half:], -beta[:half][::-1])
+
+
 def test_boundary_metrics_valid():
     alpha, beta = shadow_boundary(0.5, 60.0, n=2048)
     metrics = boundary_metrics(alpha, beta)
@@ -40,3 +48,39 @@ def test_boundary_metrics_valid():
     assert metrics["D_v"] > 0.0
     assert metrics["R_eq"] > 0.0
 
+
+def test_boundary_metrics_diameters_ignore_nans():
+    alpha = np.array([1.0, np.nan, 0.0, 0.0])
+    beta = np.array([0.0, 2.0, np.nan, -1.0])
+    metrics = boundary_metrics(alpha, beta)
+    assert metrics["D_h"] == 1.0
+    assert metrics["D_v"] == 3.0
+
+
+def test_spin_batch_matches_single_boundaries():
+    spins = [0.0, 0.3, -0.6, 0.95]
+    batch = shadow_boundaries_for_spins(spins, 60.0, n=1024)
+    for a, (alpha, beta) in zip(spins, batch):
+        alpha_ref, beta_ref = shadow_boundary(a, 60.0, n=1024)
+        assert np.allclose(alpha, alpha_ref)
+        assert np.allclose(beta, beta_ref)
+
+
+def test_out_of_range_spin_rejected():
+    for inc in (0.0, 60.0):
+        with pytest.raises(ValueError):
+            shadow_boundary(1.2, inc)
+        with pytest.raises(ValueError):
+            shadow_boundaries_for_spins([0.5, -1.2], inc)
+
+
+def test_near_extremal_spin():
+    a = 1.0 - 1.0e-10
+    for inc in (0.0, 60.0):
+        alpha, beta = shadow_boundary(a, inc, n=2048)
+        assert alpha.size > 0
+        assert not np.any(np.isnan(alpha))
+        (alpha_batch, beta_batch), = shadow_boundaries_for_spins([a], inc, n=2048)
+        assert np.allclose(alpha_batch, alpha)
+        assert np.allclose(beta_batch, beta)
+    assert boundary_metrics(alpha, beta)["R_eq"] > 0.0